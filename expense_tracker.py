@@ -3,25 +3,44 @@
 # It allows users to add expenses, view category totals, and see spending statistics
 
 import csv
+import math
 import os
-from datetime import datetime
+import re
+import sys
+from collections import defaultdict, namedtuple
+from datetime import date
+from operator import itemgetter
+
+# Column headers written at the top of the expense CSV file
+CSV_HEADER = ["Date", "Amount", "Category", "Description"]
+
+# A single expense record; much smaller than a dict per expense, with
+# fields read through attribute access
+Expense = namedtuple("Expense", ["date", "amount", "category", "description"])
+
+# Precompiled matcher for MM/DD/YYYY dates, used both in the CSV file and
+# at the prompt; much cheaper than strptime, which re-interprets the format
+# string on every call
+DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})\Z", re.ASCII)
+
+# Buffer size for CSV reads and writes (1 MiB), so large expense
+# files take far fewer read()/write() calls than the 8 KiB default
+IO_BUFFER_SIZE = 1 << 20
+
+# Longest bar in the statistics chart (100% at two percent per block);
+# each category's bar is a slice of this instead of a new string
+FULL_BAR = "█" * 50
 
 def main():
     """
     Main function that runs the expense tracker program.
     Handles the main menu and user interaction flow.
     """
-    # Initialize the list that will hold all expense records
-    expenses = []
+    # Expense records are only loaded once a menu option needs them, so
+    # sessions that just add expenses never parse the existing file
+    expenses = None
     file_path = "expenses.csv"
     
-    # Load existing expenses if the file exists
-    if os.path.exists(file_path):
-        expenses = load_expenses_from_csv(file_path)
-        print(f"Loaded {len(expenses)} expenses from file.")
-    else:
-        print("No existing expense file found. Starting fresh.")
-    
     # Main program loop - continue until user chooses to exit
     while True:
         display_menu()
@@ -29,15 +48,29 @@ def main():
         
         # Handle the user's menu choice
         if choice == '1' or choice == 'add':
-            add_expense(expenses)
-            save_expenses_to_csv(expenses, file_path)
+            # Before the history is loaded the new expense only needs to
+            # reach the file; a later load will pick it up from there
+            new_expense = add_expense(expenses if expenses is not None else [])
+            append_expenses_to_csv([new_expense], file_path)
         elif choice == '2' or choice == 'view':
+            if expenses is None:
+                expenses = load_existing_expenses(file_path)
             view_expenses(expenses)
         elif choice == '3' or choice == 'stats':
+            if expenses is None:
+                expenses = load_existing_expenses(file_path)
             show_statistics(expenses)
         elif choice == '4' or choice == 'exit':
             print("Exiting program. Goodbye!")
             break
+        elif choice == '5' or choice == 'import':
+            import_path = input("Enter path of CSV file to import: ").strip()
+            # As with add, before the history is loaded the imported rows
+            # only need to reach the file; a later load will pick them up
+            imported = bulk_import(import_path,
+                                   expenses if expenses is not None else [])
+            if imported:
+                append_expenses_to_csv(imported, file_path)
         else:
             print("Invalid choice. Please try again.")
 
@@ -50,8 +83,28 @@ def display_menu():
     print("2. View expense totals by category")
     print("3. Show expense statistics")
     print("4. Exit program")
+    print("5. Bulk import expenses from a CSV file")
     print("================================")
 
+def load_existing_expenses(file_path):
+    """
+    Loads the saved expenses, treating a missing file as a fresh start.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        list: List of Expense records
+    """
+    try:
+        expenses = load_expenses_from_csv(file_path)
+        print(f"Loaded {len(expenses)} expenses from file.")
+    except FileNotFoundError:
+        expenses = []
+        print("No existing expense file found. Starting fresh.")
+    
+    return expenses
+
 def load_expenses_from_csv(file_path):
     """
     Loads expense data from a CSV file.
@@ -60,75 +113,200 @@ def load_expenses_from_csv(file_path):
         file_path (str): Path to the CSV file
         
     Returns:
-        list: List of expense dictionaries
+        list: List of Expense records
+        
+    Raises:
+        FileNotFoundError: If the file does not exist yet
     """
     expenses = []
+    skipped = 0
     
     try:
-        with open(file_path, 'r', newline='') as file:
-            reader = csv.reader(file)
-            # Skip the header row
-            next(reader, None)
-            
-            # Process each row in the CSV
-            for row in reader:
-                if len(row) >= 4:  # Ensure the row has all required fields
-                    expense = {
-                        "date": row[0],
-                        "amount": float(row[1]),
-                        "category": row[2],
-                        "description": row[3]
-                    }
-                    expenses.append(expense)
+        skipped = _read_expense_rows(file_path, expenses)
+    except FileNotFoundError:
+        raise
     except Exception as e:
         print(f"Error loading expenses: {e}")
     
+    if skipped:
+        print(f"Skipped {skipped} invalid rows in {file_path}.")
+    
     return expenses
 
-def save_expenses_to_csv(expenses, file_path):
+def _read_expense_rows(file_path, expenses):
     """
-    Saves the expense data to a CSV file.
+    Reads the rows of an expense CSV file into a list of expenses.
+    
+    Blank lines are ignored. A row that parse_expense_row() rejects is
+    skipped and counted without losing the rows around it.
     
     Args:
-        expenses (list): List of expense dictionaries
+        file_path (str): Path to the CSV file
+        expenses (list): List of Expense records to add to
+        
+    Returns:
+        int: Number of rows skipped as invalid
+    """
+    skipped = 0
+    
+    with open(file_path, 'r', newline='', buffering=IO_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        # Skip the header row
+        next(reader, None)
+        
+        append = expenses.append
+        for row in reader:
+            if not row:  # Blank lines carry no data
+                continue
+            try:
+                append(parse_expense_row(row))
+            except ValueError:
+                skipped += 1
+    
+    return skipped
+
+def append_expenses_to_csv(new_expenses, file_path):
+    """
+    Appends expenses to the end of a CSV file.
+    
+    Only the new rows are written, so adding expenses does not rewrite
+    the whole file. The header is written first if the file is new or empty.
+    
+    Args:
+        new_expenses (list): List of Expense records to append
         file_path (str): Path to the CSV file
     """
     try:
-        with open(file_path, 'w', newline='') as file:
+        with open(file_path, 'a', newline='', buffering=IO_BUFFER_SIZE) as file:
             writer = csv.writer(file)
-            # Write header row
-            writer.writerow(["Date", "Amount", "Category", "Description"])
+            # A fresh file needs its header row before the first expense;
+            # a hand-edited file may lack a final line break, and without one
+            # the first new row would run into the last existing one
+            if file.tell() == 0:
+                writer.writerow(CSV_HEADER)
+            elif not _ends_with_newline(file_path):
+                file.write(writer.dialect.lineterminator)
             
-            # Write each expense as a row
-            for expense in expenses:
-                writer.writerow([
-                    expense["date"],
-                    expense["amount"],
-                    expense["category"],
-                    expense["description"]
-                ])
+            writer.writerows(map(format_expense_row, new_expenses))
         print(f"Expenses saved to {file_path}")
     except Exception as e:
         print(f"Error saving expenses: {e}")
 
+def _ends_with_newline(file_path):
+    """
+    Checks whether a non-empty file ends with a line break.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        bool: True if the last byte of the file is a newline
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) == b"\n"
+
+def parse_date(date_str):
+    """
+    Parses a date string in MM/DD/YYYY format.
+    
+    Args:
+        date_str (str): Date string to parse
+        
+    Returns:
+        date: The parsed date
+        
+    Raises:
+        ValueError: If the string is malformed or names an impossible date
+    """
+    match = DATE_PATTERN.match(date_str)
+    if not match:
+        raise ValueError(f"date {date_str!r} does not match MM/DD/YYYY")
+    
+    # date() range-checks the month and day, leap years included
+    month, day, year = match.groups()
+    return date(int(year), int(month), int(day))
+
+def format_date(expense_date):
+    """
+    Formats a date as MM/DD/YYYY.
+    
+    The year is always padded to four digits so that parse_date() reads
+    the result back; strftime("%Y") does not pad years before 1000 on
+    every platform.
+    
+    Args:
+        expense_date (date): Date to format
+        
+    Returns:
+        str: Formatted date string
+    """
+    return f"{expense_date.month:02d}/{expense_date.day:02d}/{expense_date.year:04d}"
+
+def parse_expense_row(row):
+    """
+    Parses one CSV row into an expense.
+    
+    Columns beyond the first four are ignored. The category is normalized
+    the same way as at the prompt.
+    
+    Args:
+        row (list): Date, amount, category and description strings
+        
+    Returns:
+        Expense: The parsed expense
+        
+    Raises:
+        ValueError: If the row is too short, the date or amount is
+            malformed, the amount is not finite or the category is empty
+    """
+    date_str, amount_str, category, description = row[:4]
+    
+    amount = float(amount_str)
+    if not math.isfinite(amount):
+        raise ValueError(f"amount {amount_str!r} is not a finite number")
+    
+    category = category.strip().capitalize()
+    if not category:
+        raise ValueError("category is empty")
+    
+    return Expense(
+        date=parse_date(date_str.strip()),
+        amount=amount,
+        category=sys.intern(category),
+        description=description.strip()
+    )
+
+def format_expense_row(expense):
+    """
+    Formats an expense as a CSV row, the inverse of parse_expense_row().
+    
+    Args:
+        expense (Expense): Expense to format
+        
+    Returns:
+        tuple: Date, amount, category and description columns
+    """
+    return (format_date(expense.date), expense.amount,
+            expense.category, expense.description)
+
 def get_valid_date_from_user():
     """
     Gets a valid date from the user in MM/DD/YYYY format.
     
     Returns:
-        str: Validated date string
+        date: Validated date
     """
     while True:
         date_str = input("Enter date (MM/DD/YYYY) or 'today' for today's date: ").strip()
         
         # Handle 'today' shortcut
         if date_str.lower() == 'today':
-            return datetime.now().strftime("%m/%d/%Y")
+            return date.today()
         
         # Validate the date format and possibility
         try:
-            date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-            return date_str
+            return parse_date(date_str)
         except ValueError:
             print("Invalid date format or impossible date. Please use MM/DD/YYYY.")
 
@@ -137,18 +315,24 @@ def add_expense(expenses):
     Adds a new expense to the expense list based on user input.
     
     Args:
-        expenses (list): List of expense dictionaries to add to
+        expenses (list): List of Expense records to add to
+        
+    Returns:
+        Expense: The newly added expense
     """
     print("\n----- Add New Expense -----")
     
     # Get date
-    date = get_valid_date_from_user()
+    expense_date = get_valid_date_from_user()
     
     # Get and validate amount
     while True:
         try:
             amount_str = input("Enter amount: $").strip()
             amount = float(amount_str)
+            if not math.isfinite(amount):
+                print("Invalid amount. Please enter a number.")
+                continue
             if amount < 0:
                 print("Amount cannot be negative. Please enter a positive number.")
                 continue
@@ -162,98 +346,158 @@ def add_expense(expenses):
         print("Category cannot be empty.")
         category = input("Enter category: ").strip().capitalize()
     
+    # Intern the category so every expense in it shares one string object,
+    # which keeps category grouping to cheap identity comparisons
+    category = sys.intern(category)
+    
     description = input("Enter description: ").strip()
     
     # Create the expense record and add it to the list
-    new_expense = {
-        "date": date,
-        "amount": amount,
-        "category": category,
-        "description": description
-    }
+    new_expense = Expense(
+        date=expense_date,
+        amount=amount,
+        category=category,
+        description=description
+    )
     
     expenses.append(new_expense)
     print(f"Expense of ${amount:.2f} for {category} added successfully!")
+    
+    return new_expense
+
+def _category_totals(expenses):
+    """
+    Sums expense amounts per category in a single pass.
+    
+    Args:
+        expenses (list): List of Expense records
+        
+    Returns:
+        dict: Mapping of category name to total amount
+    """
+    category_totals = defaultdict(float)
+    for expense in expenses:
+        category_totals[expense.category] += expense.amount
+    
+    return category_totals
+
+def bulk_import(import_path, expenses):
+    """
+    Imports expenses from a CSV file in the same format as the expense file.
+    
+    Rows are validated without prompting by the same parser as the expense
+    file; invalid rows and rows with a negative amount are skipped and
+    counted.
+    
+    Args:
+        import_path (str): Path to the CSV file to import
+        expenses (list): List of Expense records to add to
+        
+    Returns:
+        list: The newly imported expenses
+    """
+    rows = []
+    
+    try:
+        skipped = _read_expense_rows(import_path, rows)
+    except Exception as e:
+        print(f"Error importing expenses: {e}")
+        return []
+    
+    # The expense file may hold hand-entered refunds, but imported rows
+    # follow the same rule as the prompt and may not be negative
+    imported = [expense for expense in rows if expense.amount >= 0]
+    skipped += len(rows) - len(imported)
+    
+    expenses.extend(imported)
+    print(f"Imported {len(imported)} expenses ({skipped} invalid rows skipped).")
+    
+    return imported
 
 def view_expenses(expenses):
     """
     Displays expense totals grouped by category.
     
     Args:
-        expenses (list): List of expense dictionaries
+        expenses (list): List of Expense records
     """
     if not expenses:
         print("No expenses to show.")
         return
     
     # Calculate totals for each category
-    category_totals = {}
-    for expense in expenses:
-        category = expense["category"]
-        amount = expense["amount"]
-        
-        if category in category_totals:
-            category_totals[category] += amount
-        else:
-            category_totals[category] = amount
+    category_totals = _category_totals(expenses)
     
-    # Display the category totals
-    print("\n----- Expense Totals by Category -----")
+    # Build the category totals report
+    lines = ["\n----- Expense Totals by Category -----"]
     for category, total in sorted(category_totals.items()):
-        print(f"{category}: ${total:.2f}")
+        lines.append(f"{category}: ${total:.2f}")
     
-    # Calculate and display the grand total
+    # Calculate and add the grand total
     total_spent = sum(category_totals.values())
-    print(f"\nTotal Spent: ${total_spent:.2f}")
+    lines.append(f"\nTotal Spent: ${total_spent:.2f}")
+    
+    # Display the whole report with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def show_statistics(expenses):
     """
     Calculates and displays various statistics about the expenses.
     
     Args:
-        expenses (list): List of expense dictionaries
+        expenses (list): List of Expense records
     """
     if not expenses:
         print("No expenses to show statistics for.")
         return
     
-    # Calculate total spent
-    total_spent = sum(expense["amount"] for expense in expenses)
-    
-    # Find highest expense
-    highest_expense = max(expenses, key=lambda x: x["amount"])
-    
-    # Calculate category totals and percentages
-    category_totals = {}
+    # Calculate category totals and find the highest expense in a single
+    # pass; the first expense wins on ties, as with max()
+    category_totals = defaultdict(float)
+    highest_expense = expenses[0]
+    highest_amount = highest_expense.amount
     for expense in expenses:
-        category = expense["category"]
-        amount = expense["amount"]
+        amount = expense.amount
+        category_totals[expense.category] += amount
         
-        if category in category_totals:
-            category_totals[category] += amount
-        else:
-            category_totals[category] = amount
-    
-    # Calculate percentages
-    category_percentages = {}
-    for category, total in category_totals.items():
-        percentage = (total / total_spent) * 100
-        category_percentages[category] = percentage
-    
-    # Display statistics
-    print("\n----- Expense Statistics -----")
-    print(f"Total Spent: ${total_spent:.2f}")
-    print(f"Highest Expense: ${highest_expense['amount']:.2f} for " +
-          f"{highest_expense['category']} on {highest_expense['date']} " +
-          f"({highest_expense['description']})")
-    
-    # Display category breakdown with ASCII chart
-    print("\nSpending Breakdown by Category:")
+        if amount > highest_amount:
+            highest_expense = expense
+            highest_amount = amount
+    
+    # The overall total falls out of the category totals
+    total_spent = sum(category_totals.values())
+    
+    # Calculate percentages, scaling by one precomputed factor rather
+    # than dividing each category total separately
+    scale = 100.0 / total_spent
+    category_percentages = {category: total * scale
+                            for category, total in category_totals.items()}
+    
+    # Build the statistics report
+    lines = [
+        "\n----- Expense Statistics -----",
+        f"Total Spent: ${total_spent:.2f}",
+        f"Highest Expense: ${highest_expense.amount:.2f} for " +
+        f"{highest_expense.category} on {format_date(highest_expense.date)} " +
+        f"({highest_expense.description})",
+    ]
+    
+    # Add category breakdown with ASCII chart
+    lines.append("\nSpending Breakdown by Category:")
     for category, percentage in sorted(category_percentages.items(), 
-                                      key=lambda x: x[1], reverse=True):
+                                      key=itemgetter(1), reverse=True):
         bar_length = round(percentage / 2)  # Scale for display
-        bar = "█" * bar_length
-        print(f"{category}: {percentage:.1f}% {bar}")
+        if bar_length <= len(FULL_BAR):
+            # Clamp so a negative share (refunds) gets no bar instead of
+            # slicing from the end
+            bar = FULL_BAR[:max(bar_length, 0)]
+        else:
+            # Refunds can push other categories above 100%
+            bar = "█" * bar_length
+        lines.append(f"{category}: {percentage:.1f}% {bar}")
+    
+    # Display the whole report with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # Call the main function when the script is run
 if __name__ == "__main__":